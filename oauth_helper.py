@@ -3,11 +3,15 @@
 
 import sys
 import os
+import socket
 import json
+import urllib.error
 import urllib.request
 import locale
+import functools
 import argparse
 
+from PyQt5 import sip
 from PyQt5.QtWidgets import (
     QApplication,
     QWidget,
@@ -17,15 +21,52 @@ from PyQt5.QtWidgets import (
     QComboBox,
     QMessageBox,
 )
-from PyQt5.QtWebEngineWidgets import QWebEngineView, QWebEnginePage
-from PyQt5.QtCore import QUrl, Qt
-from urllib.parse import urlparse, parse_qs
+from PyQt5.QtCore import (
+    QUrl,
+    QUrlQuery,
+    Qt,
+    QThread,
+    QLoggingCategory,
+    pyqtSignal,
+)
+
+# Prefer orjson for parsing when installed; both parsers accept bytes or str.
+try:
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
+# Prefer a pooled keep-alive requests session (with retries) when available,
+# falling back to plain urllib otherwise.
+try:
+    import requests
+    import urllib3.exceptions
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    _SESSION = requests.Session()
+    _SESSION.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=2,
+            # One connect retry; read errors are re-raised as-is (no retry),
+            # so requests reports them as ReadTimeout
+            max_retries=Retry(total=3, connect=1, read=False, backoff_factor=0.3),
+        ),
+    )
+except ImportError:
+    _SESSION = None
 
 LANG = None
 # Allow enabling debug via environment variable STELLANTIS_DEBUG=1/true/yes
-DEBUG = os.getenv("STELLANTIS_DEBUG", "f").lower()[0] in ["1", "t", "y"]
+DEBUG = os.getenv("STELLANTIS_DEBUG", "f")[:1].lower() in {"1", "t", "y"}
 
 CONFIG_URL = "https://raw.githubusercontent.com/andreadegiovine/homeassistant-stellantis-vehicles/develop/custom_components/stellantis_vehicles/configs.json"
+# Per-attempt (connect, read) timeouts in seconds so a stalled network fails
+# fast. The connect timeout applies to each resolved address and the read
+# timeout to each socket read, so they do not bound the total download time.
+CONFIG_TIMEOUT = (3.05, 10)
 
 # Simple i18n mechanism with per-language string maps and a selector.
 # Add more languages by extending STRINGS.
@@ -37,10 +78,12 @@ STRINGS = {
         "CONTINUE_BUTTON": "Continue",
         "OAUTH_POPUP_TITLE": "OAuth Code Retrieved",
         "COPY_BUTTON_TEXT": "Copy the code",
+        "LOADING": "Loading configurations…",
         "CONFIGS_DOWNLOADED": "Configurations downloaded: {}",
         "CONFIGS_ERROR": "Error downloading configurations: {}",
         "ERROR_TITLE": "Error",
         "ERROR_MESSAGE": "Failed to download configurations: {}",
+        "TIMEOUT_MESSAGE": "Timed out downloading configurations. Check your network connection and try again.",
         "NO_COUNTRIES_FOR_BRAND": "No countries available for brand: {}",
         "AUTH_URL_LOG": "Authentication URL: {}",
         "MISSING_KEY_LOG": "Error: Missing key - {}",
@@ -56,10 +99,12 @@ STRINGS = {
         "CONTINUE_BUTTON": "Continuer",
         "OAUTH_POPUP_TITLE": "Code OAuth récupéré",
         "COPY_BUTTON_TEXT": "Copier le code",
+        "LOADING": "Chargement des configurations…",
         "CONFIGS_DOWNLOADED": "Configurations téléchargées : {}",
         "CONFIGS_ERROR": "Erreur lors du téléchargement des configurations : {}",
         "ERROR_TITLE": "Erreur",
         "ERROR_MESSAGE": "Échec du téléchargement des configurations : {}",
+        "TIMEOUT_MESSAGE": "Délai dépassé lors du téléchargement des configurations. Vérifiez votre connexion réseau et réessayez.",
         "NO_COUNTRIES_FOR_BRAND": "Aucun pays disponible pour la marque : {}",
         "AUTH_URL_LOG": "URL d'authentification : {}",
         "MISSING_KEY_LOG": "Erreur : clé manquante - {}",
@@ -71,31 +116,36 @@ STRINGS = {
 }
 
 
+@functools.lru_cache(maxsize=1)
 def detect_language():
     """Detect a suitable language code avoiding deprecated getdefaultlocale().
 
     Order of detection:
-    1. locale.setlocale + locale.getlocale()
-    2. Environment variables: LC_ALL, LC_CTYPE, LANG
+    1. Environment variables: LC_ALL, LC_CTYPE, LANG (no setlocale needed)
+    2. locale.setlocale + locale.getlocale()
     3. Fallback 'en'
-    Returns base language (e.g. 'en', 'fr').
+    Returns base language (e.g. 'en', 'fr'). The result is cached.
     """
+    lang_code = next(
+        (
+            os.environ[v].strip()
+            for v in ("LC_ALL", "LC_CTYPE", "LANG")
+            if os.environ.get(v, "").strip()
+        ),
+        "",
+    )
+    base = lang_code.replace("-", "_").split("_")[0].lower()
+    if base in STRINGS:
+        return base
     try:
         # Initialise locale from environment ('' means user default)
         locale.setlocale(locale.LC_ALL, "")
     except Exception:
         pass
-    lang_code = None
     try:
         lang_code = (locale.getlocale()[0] or "").strip()
     except Exception:
         lang_code = ""
-    if not lang_code:
-        for var in ("LC_ALL", "LC_CTYPE", "LANG"):
-            val = os.environ.get(var, "").strip()
-            if val:
-                lang_code = val
-                break
     if not lang_code:
         lang_code = "en"
     # Normalise separators and extract base
@@ -103,26 +153,147 @@ def detect_language():
     return base if base in STRINGS else "en"
 
 
-# Initialise language if not already overridden later via CLI
-if LANG is None:
-    LANG = detect_language()
+# Active string table: the selected language flattened over the English
+# fallback, so t() resolves every key with a single dict lookup
+_L = dict(STRINGS["en"])
+
+
+def set_language(lang):
+    """Set LANG and bind its string table so t() avoids per-call lookups."""
+    global LANG, _L
+    LANG = lang
+    _L = {**STRINGS["en"], **STRINGS.get(lang, {})}
 
 
 def t(key):
-    return STRINGS.get(LANG, STRINGS["en"]).get(key, key)
+    return _L.get(key, key)
 
 
-def download_configs():
+def get_cache_dir():
+    """Return the per-user cache directory for this tool (XDG aware)."""
+    base = os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache"))
+    return os.path.join(base, "stellantis-oauth-helper")
+
+
+CONFIG_CACHE_FILE = os.path.join(get_cache_dir(), "configs.json")
+
+
+def load_cached_configs():
+    """Load the cached configs entry ({etag, last_modified, body}) or None."""
     try:
-        with urllib.request.urlopen(CONFIG_URL) as response:
-            data = json.loads(response.read().decode())
-            if DEBUG:
-                print(t("CONFIGS_DOWNLOADED").format(data))
-            return data
+        with open(CONFIG_CACHE_FILE, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if isinstance(cached, dict) and "body" in cached:
+            return cached
+    except Exception:
+        pass
+    return None
+
+
+def save_cached_configs(etag, last_modified, body):
+    """Atomically persist the configs body and its validators to disk."""
+    try:
+        os.makedirs(os.path.dirname(CONFIG_CACHE_FILE), exist_ok=True)
+        tmp_path = CONFIG_CACHE_FILE + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"etag": etag, "last_modified": last_modified, "body": body}, f
+            )
+        os.replace(tmp_path, CONFIG_CACHE_FILE)
     except Exception as e:
-        print(t("CONFIGS_ERROR").format(e))
-        QMessageBox.critical(None, t("ERROR_TITLE"), t("ERROR_MESSAGE").format(e))
-        sys.exit(1)
+        if DEBUG:
+            print(f"Could not write configs cache: {e}")
+
+
+def fetch_configs(headers):
+    """Fetch CONFIG_URL with the given request headers.
+
+    Returns (body, etag, last_modified); body is the raw bytes, or None on
+    304 Not Modified.
+    """
+    if _SESSION is not None:
+        response = _SESSION.get(CONFIG_URL, headers=headers, timeout=CONFIG_TIMEOUT)
+        if response.status_code == 304:
+            return None, None, None
+        response.raise_for_status()
+        return (
+            response.content,
+            response.headers.get("ETag"),
+            response.headers.get("Last-Modified"),
+        )
+
+    request = urllib.request.Request(CONFIG_URL, headers=headers)
+    try:
+        with urllib.request.urlopen(request, timeout=CONFIG_TIMEOUT[1]) as response:
+            return (
+                response.read(),
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified"),
+            )
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return None, None, None
+        raise
+
+
+def download_configs():
+    cached = load_cached_configs()
+    headers = {}
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+    body, etag, last_modified = fetch_configs(headers)
+    if body is None:
+        # 304 Not Modified: the cached copy is still current
+        if not cached:
+            raise ValueError("304 Not Modified without a cached copy")
+        body = cached["body"]
+    data = _loads(body)
+    if etag is not None or last_modified is not None:
+        save_cached_configs(etag, last_modified, body.decode())
+    if DEBUG:
+        print(t("CONFIGS_DOWNLOADED").format(data))
+    return data
+
+
+def is_timeout_error(e):
+    """Return True if e is a connect/read timeout from requests or urllib."""
+    if isinstance(e, urllib.error.URLError):
+        e = e.reason
+    if isinstance(e, socket.timeout):
+        return True
+    if _SESSION is None:
+        return False
+    if isinstance(e, requests.Timeout):
+        return True
+    # A timeout while reading the body is re-raised by requests as a
+    # ConnectionError wrapping urllib3's ReadTimeoutError. Other connection
+    # errors (refused, DNS) are deliberately not treated as timeouts.
+    return (
+        isinstance(e, requests.ConnectionError)
+        and bool(e.args)
+        and isinstance(e.args[0], urllib3.exceptions.ReadTimeoutError)
+    )
+
+
+class ConfigLoader(QThread):
+    """Download the configs off the GUI thread so the event loop starts at once."""
+
+    loaded = pyqtSignal(object)
+    failed = pyqtSignal(str)
+    timed_out = pyqtSignal(str)
+
+    def run(self):
+        try:
+            self.loaded.emit(download_configs())
+        except Exception as e:
+            print(t("CONFIGS_ERROR").format(e))
+            if is_timeout_error(e):
+                self.timed_out.emit(str(e))
+            else:
+                self.failed.emit(str(e))
 
 
 class BrandCountrySelector(QWidget):
@@ -139,6 +310,9 @@ class BrandCountrySelector(QWidget):
 
         self.brand_combo = QComboBox()
         self.valid_brands = [b for b in configs if "configs" in configs[b]]
+        self._brand_countries = {
+            b: sorted(configs[b]["configs"].keys()) for b in self.valid_brands
+        }
         self.brand_combo.addItems(self.valid_brands)
         self.brand_combo.currentTextChanged.connect(self.update_countries)
         self.layout.addWidget(self.brand_combo)
@@ -156,15 +330,16 @@ class BrandCountrySelector(QWidget):
         self.setLayout(self.layout)
         self.update_countries(self.brand_combo.currentText())
 
+        self.browser_window = None
+
     def update_countries(self, brand_name):
         self.country_combo.clear()
-        try:
-            countries = self.configs[brand_name]["configs"].keys()
-            self.country_combo.addItems(sorted(countries))
+        countries = self._brand_countries.get(brand_name)
+        if countries:
+            self.country_combo.addItems(countries)
             self.country_combo.setCurrentIndex(0)
-        except KeyError:
+        else:
             print(t("NO_COUNTRIES_FOR_BRAND").format(brand_name))
-            self.country_combo.clear()
 
     def launch_browser(self):
         brand = self.brand_combo.currentText()
@@ -178,13 +353,21 @@ class BrandCountrySelector(QWidget):
             locale_code = country_cfg["locale"]
             client_id = country_cfg["client_id"]
 
-            auth_url = (
-                f"{oauth_url}/am/oauth2/authorize?client_id={client_id}&response_type=code"
-                f"&redirect_uri={scheme}://oauth2redirect/{country.lower()}&scope=openid%20profile%20email&locale={locale_code}"
+            auth_url = QUrl(oauth_url + "/am/oauth2/authorize")
+            query = QUrlQuery()
+            query.setQueryItems(
+                [
+                    ("client_id", client_id),
+                    ("response_type", "code"),
+                    ("redirect_uri", f"{scheme}://oauth2redirect/{country.lower()}"),
+                    ("scope", "openid profile email"),
+                    ("locale", locale_code),
+                ]
             )
+            auth_url.setQuery(query)
 
             if DEBUG:
-                print(t("AUTH_URL_LOG").format(auth_url))
+                print(t("AUTH_URL_LOG").format(auth_url.toString()))
 
             self.browser_window = OAuthBrowser(auth_url, scheme)
             self.browser_window.show()
@@ -196,44 +379,86 @@ class BrandCountrySelector(QWidget):
             )
 
 
-class CustomWebPage(QWebEnginePage):
-    def __init__(self, scheme, parent=None):
-        super(CustomWebPage, self).__init__(parent)
-        self.scheme = scheme
+_WEB_PROFILE = None
 
-    def javaScriptConsoleMessage(self, level, message, lineNumber, sourceID):
-        # Suppress JS console output unless DEBUG enabled
-        if DEBUG:
-            try:
-                level_name = {0: "Info", 1: "Warning", 2: "Error"}.get(
-                    int(level), str(level)
+
+def get_web_profile():
+    """Return a shared profile with an on-disk HTTP cache.
+
+    Reusing cached assets across runs speeds up re-login. Cookies are not
+    persisted, but cached responses and site storage (localStorage,
+    IndexedDB, service workers) are kept under the cache directory.
+    """
+    global _WEB_PROFILE
+    if _WEB_PROFILE is None:
+        from PyQt5.QtWebEngineWidgets import QWebEngineProfile
+
+        profile = QWebEngineProfile("stellantis", QApplication.instance())
+        profile.setHttpCacheType(QWebEngineProfile.DiskHttpCache)
+        profile.setPersistentCookiesPolicy(QWebEngineProfile.NoPersistentCookies)
+        profile.setCachePath(os.path.join(get_cache_dir(), "webcache"))
+        profile.setPersistentStoragePath(os.path.join(get_cache_dir(), "webstorage"))
+        _WEB_PROFILE = profile
+    return _WEB_PROFILE
+
+
+# QtWebEngine pulls in Chromium, so it is only imported once the browser is
+# actually needed; the page class is built on first use and cached here.
+_CUSTOM_WEB_PAGE = None
+
+
+def get_custom_web_page_class():
+    global _CUSTOM_WEB_PAGE
+    if _CUSTOM_WEB_PAGE is not None:
+        return _CUSTOM_WEB_PAGE
+
+    from PyQt5.QtWebEngineWidgets import QWebEnginePage
+
+    # Built after CLI parsing, so DEBUG is final; bind it for the hot paths
+    debug = DEBUG
+
+    class CustomWebPage(QWebEnginePage):
+        def __init__(self, scheme, profile, parent=None):
+            super(CustomWebPage, self).__init__(profile, parent)
+            self.scheme = scheme
+
+        if debug:
+            # Only override when debugging; otherwise Qt's C++ handler runs
+            # directly and its "js" log category is silenced below.
+            def javaScriptConsoleMessage(self, level, message, lineNumber, sourceID):
+                try:
+                    level_name = {0: "Info", 1: "Warning", 2: "Error"}.get(
+                        int(level), str(level)
+                    )
+                except Exception:
+                    level_name = str(level)
+                print(f"JS {level_name}: {message} (line {lineNumber})")
+                # Call super for any internal handling if needed
+                return super(CustomWebPage, self).javaScriptConsoleMessage(
+                    level, message, lineNumber, sourceID
                 )
-            except Exception:
-                level_name = str(level)
-            print(f"JS {level_name}: {message} (line {lineNumber})")
-            # Call super for any internal handling if needed
-            return super(CustomWebPage, self).javaScriptConsoleMessage(
-                level, message, lineNumber, sourceID
+
+        def acceptNavigationRequest(self, url, nav_type, is_main_frame):
+            # Compare the already-parsed scheme; never stringify the full URL
+            if url.scheme() == self.scheme:
+                code = QUrlQuery(url).queryItemValue("code", QUrl.FullyDecoded)
+                if debug:
+                    print("=" * 20)
+                    print(t("OAUTH_CODE_LABEL").format(code))
+                    print("=" * 20)
+
+                self.view().parent().show_oauth_popup(code)
+                return False
+            return super(CustomWebPage, self).acceptNavigationRequest(
+                url, nav_type, is_main_frame
             )
-        # When not debugging, do nothing (suppress output)
-        return
-
-    def acceptNavigationRequest(self, url, nav_type, is_main_frame):
-        url_str = url.toString()
-        if url_str.startswith("{}://".format(self.scheme)):
-            parsed = urlparse(url_str)
-            params = parse_qs(parsed.query)
-            code = params.get("code", [""])[0]
-            if DEBUG:
-                print("=" * 20)
-                print(t("OAUTH_CODE_LABEL").format(code))
-                print("=" * 20)
-
-            self.view().parent().show_oauth_popup(code)
-            return False
-        return super(CustomWebPage, self).acceptNavigationRequest(
-            url, nav_type, is_main_frame
-        )
+
+    if not debug:
+        # Suppress JS console output without a Python round-trip per message
+        QLoggingCategory.setFilterRules("js=false")
+
+    _CUSTOM_WEB_PAGE = CustomWebPage
+    return CustomWebPage
 
 
 class OAuthBrowser(QWidget):
@@ -242,13 +467,23 @@ class OAuthBrowser(QWidget):
         self.setWindowTitle(t("BROWSER_WINDOW_TITLE"))
         self.setGeometry(300, 300, 900, 700)
 
+        from PyQt5.QtWebEngineWidgets import QWebEngineView, QWebEngineSettings
+
         layout = QVBoxLayout(self)
         self.webview = QWebEngineView(self)
-        self.page = CustomWebPage(scheme, self.webview)
+        self.page = get_custom_web_page_class()(
+            scheme, get_web_profile(), self.webview
+        )
         self.webview.setPage(self.page)
+        # The login form needs none of these; skipping them saves GPU work
+        settings = self.page.settings()
+        settings.setAttribute(QWebEngineSettings.WebGLEnabled, False)
+        settings.setAttribute(QWebEngineSettings.PluginsEnabled, False)
+        settings.setAttribute(QWebEngineSettings.Accelerated2dCanvasEnabled, False)
+        settings.setAttribute(QWebEngineSettings.AutoLoadIconsForPage, False)
         layout.addWidget(self.webview)
 
-        self.webview.load(QUrl(auth_url))
+        self.webview.load(auth_url)
 
     def show_oauth_popup(self, code):
         self.popup = OAuthPopup(code)
@@ -268,7 +503,9 @@ class OAuthPopup(QWidget):
         layout.addWidget(self.label)
 
         self.copy_button = QPushButton(t("COPY_BUTTON_TEXT"))
-        self.copy_button.clicked.connect(lambda: QApplication.clipboard().setText(code))
+        self.copy_button.clicked.connect(
+            functools.partial(QApplication.clipboard().setText, code)
+        )
         layout.addWidget(self.copy_button)
 
         self.setLayout(layout)
@@ -278,6 +515,8 @@ if __name__ == "__main__":
     # Enable High DPI scaling for better appearance on 4K/HiDPI displays
     QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
     QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
+    # Required so QtWebEngineWidgets can be imported after QApplication exists
+    QApplication.setAttribute(Qt.AA_ShareOpenGLContexts, True)
     # Allow pass-through rounding for precise scale factors
     try:
         from PyQt5.QtGui import QGuiApplication
@@ -303,18 +542,10 @@ if __name__ == "__main__":
     if args.debug:
         DEBUG = True
 
-    # Apply locale override if provided; fallback to 'en' when unknown
-    if locale_arg:
-        try:
-            base_locale = locale_arg.split("_")[0]
-        except Exception:
-            base_locale = locale_arg
-        if base_locale in STRINGS:
-            LANG = base_locale
-        else:
-            LANG = detect_language()
-
-    configs = download_configs()
+    # Apply locale override if provided; otherwise (or when unknown) detect
+    # once from the environment, which is the only detect_language() call
+    base_locale = locale_arg.split("_")[0] if locale_arg else None
+    set_language(base_locale if base_locale in STRINGS else detect_language())
 
     app = QApplication(sys.argv)
     # Scale default font based on DPI (96dpi as baseline), with stronger boost on very high DPI
@@ -343,7 +574,46 @@ if __name__ == "__main__":
     except Exception:
         pass
 
-    selector = BrandCountrySelector(configs)
-    selector.show()
+    loading = QLabel(t("LOADING"))
+    loading.setWindowTitle(t("WINDOW_TITLE"))
+    loading.setAlignment(Qt.AlignCenter)
+    loading.setGeometry(400, 300, 400, 200)
+    loading.show()
+
+    selector = None
+
+    def show_selector(configs):
+        global selector
+        selector = BrandCountrySelector(configs)
+        selector.show()
+        loading.close()
+
+    def show_error(message):
+        QMessageBox.critical(
+            loading, t("ERROR_TITLE"), t("ERROR_MESSAGE").format(message)
+        )
+        app.exit(1)
+
+    def show_timeout(message):
+        QMessageBox.warning(loading, t("ERROR_TITLE"), t("TIMEOUT_MESSAGE"))
+        app.exit(1)
+
+    loader = ConfigLoader()
+    loader.loaded.connect(show_selector)
+    loader.failed.connect(show_error)
+    loader.timed_out.connect(show_timeout)
+    # Closing the loading window (or an error) quits the app while run() may
+    # still be on the network; the thread must finish before it is destroyed
+    app.aboutToQuit.connect(loader.wait)
+
+    def release_browser():
+        # Pages must be destroyed before the shared web profile, which is
+        # owned by the QApplication
+        if selector is not None and selector.browser_window is not None:
+            sip.delete(selector.browser_window)
+            selector.browser_window = None
+
+    app.aboutToQuit.connect(release_browser)
+    loader.start()
 
     sys.exit(app.exec_())